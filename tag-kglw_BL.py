@@ -1,11 +1,17 @@
+import bisect
+import hashlib
+import json
+import os
 import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
-from mutagen import File as MutagenFile
-from mutagen.flac import FLAC
-
 # ------------------------------------
 # HARDCODE YOUR SETLIST.FM API KEY HERE
 # ------------------------------------
@@ -18,18 +24,72 @@ AUDIO_EXTS = {
     ".flac", ".mp3", ".m4a", ".ogg", ".wav", ".wv", ".aiff", ".aif"
 }
 
-LIVE_IN_REGEX = re.compile(r"\s*\(Live in.*?\)", re.IGNORECASE)
+SETLISTFM_SEARCH_URL = "https://api.setlist.fm/rest/1.0/search/setlists"
+
+# Concurrent Setlist.fm requests; also the connection pool size, so every
+# worker keeps its own keep-alive socket. Kept low for the API rate limit.
+_SETLISTFM_MAX_CONCURRENCY = 4
+
+# Setlist.fm responses are cached per date so re-runs skip the network.
+# Entries older than this are revalidated with If-None-Match (ETag).
+# Pass --refresh to ignore the cache, e.g. while a setlist is still being edited.
+# Responses are keyed by artist + date, so editing ARTIST_NAME (or copying the
+# script for another band) never picks up another artist's cached setlist.
+_CACHE_ROOT = os.environ.get("LOCALAPPDATA" if os.name == "nt" else "XDG_CACHE_HOME")
+if not _CACHE_ROOT or not os.path.isabs(_CACHE_ROOT):
+    _CACHE_ROOT = Path.home() / ".cache"
+SETLISTFM_CACHE_DIR = Path(_CACHE_ROOT) / "kglw-bootleg-tagger" / "setlistfm"
+SETLISTFM_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# One shared session so every date reuses the same keep-alive connection.
+# requests / mutagen are imported lazily so the usage path starts fast.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Set by load_audio on first use
+_FLAC = None
+_MUTAGEN_FILE = None
+_MUTAGEN_LOCK = threading.Lock()
+
+# Per-file constant tag values. Some mutagen backends (e.g. EasyMP4) store the
+# assigned list as-is, so tag_with_mutagen hands out copies, never these.
+_ARTIST_LIST = [ARTIST_NAME]
+# four backslashes in literal → two backslashes in tag
+_GENRE_LIST = ["Psychedelic Rock\\\\Jam Band"]
+_RELEASETYPE_LIST = ["album;live"]
+
+# metaflac is much faster than mutagen at rewriting FLAC tags; use it if present
+_METAFLAC = shutil.which("metaflac")
+
+# Tags that are always cleared and rewritten by tag_with_mutagen
+_CONTROLLED_KEYS = (
+    "album", "artist", "albumartist",
+    "genre", "discnumber", "date", "year",
+    "releasetype", "tracknumber", "title"
+)
+
+# [^)]* scans linearly to the closing paren, no lazy backtracking
+_LIVE_IN_RE = re.compile(r"\s*\(Live in[^)]*\)", re.IGNORECASE)
+
+# "07 Extinction" / "07 - Extinction" / "7. Extinction"
+_TRACK_RE = re.compile(r"^\s*(\d+)\s*(?:[-.]\s*|\s+)(\S.*?)\s*$")
+
+# Characters not allowed in Windows file / folder names
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '\\/:*?"<>|'})
 
 
 def clean_live_in(text: str) -> str:
     if not text:
         return text
-    return LIVE_IN_REGEX.sub("", text).strip()
+    # Cheap substring test before invoking the regex engine
+    if "(live in" not in text.lower():
+        return text.strip()
+    return _LIVE_IN_RE.sub("", text).strip()
 
 
 def sanitize_filename(name: str) -> str:
     # Windows-safe filename / folder name
-    return re.sub(r'[\\/:*?"<>|]', "_", name)
+    return name.translate(_SANITIZE_TABLE)
 
 
 def parse_track_from_title(track_title: str):
@@ -42,101 +102,198 @@ def parse_track_from_title(track_title: str):
       '7. Extinction'
       'Extinction' -> (None, 'Extinction')
     """
-    if not track_title:
-        return None, ""
-
-    s = track_title.strip()
-
-    # "07 Extinction"
-    m = re.match(r"^\s*(\d+)\s+(.+)$", s)
+    m = _TRACK_RE.match(track_title or "")
     if m:
-        return int(m.group(1)), m.group(2).strip()
+        return int(m.group(1)), m.group(2)
+
+    return None, (track_title or "").strip()
+
+
+def _get_session():
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=_SETLISTFM_MAX_CONCURRENCY,
+                    pool_maxsize=_SETLISTFM_MAX_CONCURRENCY,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        # Hand back the last response so the status/body
+                        # error below is shown instead of a RetryError
+                        raise_on_status=False,
+                    ),
+                ),
+            )
+            session.headers.update({
+                "x-api-key": SETLISTFM_API_KEY,
+                "Accept": "application/json",
+                "Accept-Language": "en",
+                "User-Agent": "kglw-bootleg-tagger/1.0",
+            })
+            _SESSION = session
+    return _SESSION
+
+
+def _setlist_cache_path(date_iso: str) -> Path:
+    # Readable slug plus a short hash so non-ASCII names can't collide
+    slug = re.sub(r"[^a-z0-9]+", "-", ARTIST_NAME.lower()).strip("-")
+    digest = hashlib.sha1(ARTIST_NAME.encode("utf-8")).hexdigest()[:8]
+    return SETLISTFM_CACHE_DIR / f"{slug}-{digest}" / f"{date_iso}.json"
+
+
+def _read_setlist_cache(date_iso: str):
+    """
+    Return (entry, is_fresh) for a cached date, or (None, False) if there is
+    no usable cache file. entry is {"etag": ..., "data": ...}.
+    """
+    path = _setlist_cache_path(date_iso)
+    try:
+        age = time.time() - path.stat().st_mtime
+        with path.open(encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None, False
+
+    # Anything that isn't the shape we write is treated as a cache miss
+    if (
+        not isinstance(entry, dict)
+        or not isinstance(entry.get("data"), dict)
+        or not isinstance(entry.get("etag"), (str, type(None)))
+    ):
+        return None, False
 
-    # "07 - Extinction" / "7. Extinction"
-    m = re.match(r"^\s*(\d+)\s*[-.\s]\s*(.+)$", s)
-    if m:
-        return int(m.group(1)), m.group(2).strip()
+    return entry, age < SETLISTFM_CACHE_TTL
 
-    return None, s
 
+def _write_setlist_cache(date_iso: str, etag, data):
+    path = _setlist_cache_path(date_iso)
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name per writer; the same date may be fetched twice at once
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent,
+            prefix=f"{date_iso}.", suffix=".tmp", delete=False,
+        ) as f:
+            tmp = f.name
+            json.dump({"etag": etag, "data": data}, f)
+        os.replace(tmp, path)
+    except OSError:
+        # caching is best-effort
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
-def fetch_album_name_and_setlist(date_iso: str):
+
+def fetch_album_name_and_setlist(date_iso: str, refresh: bool = False):
     """
     For a single date:
       - Build album location info (venue/city/country)
       - Return (album_suffix, setlist_song_names)
 
     album_suffix is "Venue City Country" portion (no date, no ' (Bootlegger)' yet).
+    refresh=True ignores any cached response and always fetches live.
     """
     if not SETLISTFM_API_KEY:
         raise RuntimeError("You must set SETLISTFM_API_KEY in the script.")
 
-    try:
-        y, m, d = date_iso.split("-")
-        date_ddmmyyyy = f"{d}-{m}-{y}"
-    except ValueError:
+    # date_iso is also used as a cache file name, so insist on ASCII digits
+    digits = date_iso[0:4] + date_iso[5:7] + date_iso[8:10]
+    if (
+        len(date_iso) != 10 or date_iso[4] != "-" or date_iso[7] != "-"
+        or not (digits.isascii() and digits.isdigit())
+    ):
         raise ValueError(f"Date must be yyyy-mm-dd, got: {date_iso!r}")
+    date_ddmmyyyy = f"{date_iso[8:10]}-{date_iso[5:7]}-{date_iso[0:4]}"
 
-    url = "https://api.setlist.fm/rest/1.0/search/setlists"
-    headers = {
-        "x-api-key": SETLISTFM_API_KEY,
-        "Accept": "application/json",
-        "Accept-Language": "en",
-        "User-Agent": "kglw-bootleg-tagger/1.0",
-    }
     params = {
         "artistName": ARTIST_NAME,
         "date": date_ddmmyyyy,
         "p": 1,
     }
 
-    print(f"\n🔎 Querying Setlist.fm for {ARTIST_NAME} on {date_ddmmyyyy} ...")
-    resp = requests.get(url, headers=headers, params=params, timeout=15)
+    if refresh:
+        cached, fresh = None, False
+    else:
+        cached, fresh = _read_setlist_cache(date_iso)
 
-    if resp.status_code != 200:
-        raise RuntimeError(f"Setlist.fm API error {resp.status_code}: {resp.text}")
+    if fresh:
+        print(f"\n📦 Using cached Setlist.fm data for {date_ddmmyyyy}")
+        data = cached["data"]
+    else:
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        print(f"\n🔎 Querying Setlist.fm for {ARTIST_NAME} on {date_ddmmyyyy} ...")
+        resp = _get_session().get(
+            SETLISTFM_SEARCH_URL, params=params, headers=headers, timeout=15
+        )
+
+        if resp.status_code == 304 and cached:
+            data = cached["data"]
+            etag = cached.get("etag")
+        elif resp.status_code == 200:
+            data = resp.json()
+            etag = resp.headers.get("ETag")
+        else:
+            raise RuntimeError(f"Setlist.fm API error {resp.status_code}: {resp.text}")
+
+        if data.get("setlist"):
+            _write_setlist_cache(date_iso, etag, data)
 
-    data = resp.json()
     setlists = data.get("setlist") or []
     if not setlists:
         raise RuntimeError(f"No setlist found for {date_iso}")
 
     s = setlists[0]
 
-    venue = s.get("venue", {}) or {}
-    city = venue.get("city", {}) or {}
+    venue = s.get("venue") or {}
+    city = venue.get("city") or {}
+    country = city.get("country") or {}
 
     venue_name = venue.get("name") or ""
     city_name = city.get("name") or ""
-    country = city.get("country", {}) or {}
     country_name = country.get("name") or country.get("code") or ""
 
-    parts = [venue_name]
-    if city_name:
-        parts.append(city_name)
-    if country_name:
-        parts.append(country_name)
-
-    location = " ".join(parts).strip()
+    location = " ".join(p for p in (venue_name, city_name, country_name) if p)
 
     # Extract setlist songs
-    setlist_songs = []
-    sets_block = s.get("sets", {})
-    if isinstance(sets_block, dict):
-        for set_block in sets_block.get("set", []):
-            if "song" in set_block:
-                for song in set_block["song"]:
-                    name = song.get("name")
-                    if name:
-                        setlist_songs.append(name)
+    sets_block = s.get("sets") or {}
+    setlist_songs = [
+        name
+        for set_block in (sets_block.get("set") or [])
+        for song in (set_block.get("song") or [])
+        if (name := song.get("name"))
+    ]
 
     return location, setlist_songs
 
 
-def load_audio(path: Path):
-    if path.suffix.lower() == ".flac":
-        return FLAC(path)
-    return MutagenFile(path, easy=True)
+def load_audio(path: Path, suffix: str):
+    global _FLAC, _MUTAGEN_FILE
+    with _MUTAGEN_LOCK:
+        if _FLAC is None:
+            from mutagen import File as MutagenFile
+            from mutagen.flac import FLAC
+
+            _MUTAGEN_FILE = MutagenFile
+            _FLAC = FLAC
+
+    if suffix == ".flac":
+        return _FLAC(path)
+    return _MUTAGEN_FILE(path, easy=True)
 
 
 def get_track_info_from_tags_or_filename(path: Path, audio):
@@ -146,6 +303,7 @@ def get_track_info_from_tags_or_filename(path: Path, audio):
     3. Parse number + title.
     4. If no number, fallback to filename pattern.
     """
+    stem = path.stem
     title_tag = None
 
     for key in ("title", "tracktitle"):
@@ -156,78 +314,131 @@ def get_track_info_from_tags_or_filename(path: Path, audio):
                 break
 
     if not title_tag:
-        title_tag = path.stem
+        title_tag = stem
 
     title_cleaned = clean_live_in(title_tag)
+    # Untagged rips: the title already is the stem, don't clean it twice
+    stem_clean = title_cleaned if title_tag == stem else clean_live_in(stem)
 
-    track_no, clean_title = parse_track_from_title(title_cleaned)
+    candidates = (
+        title_cleaned,
+        stem_clean.rsplit(" - ", 1)[-1] if " - " in stem_clean else None,
+    )
+    for cand in candidates:
+        if cand:
+            track_no, clean_title = parse_track_from_title(cand)
+            if track_no is not None:
+                return track_no, clean_title
 
-    if track_no is None:
-        stem_clean = clean_live_in(path.stem)
-        if " - " in stem_clean:
-            last_part = stem_clean.rsplit(" - ", 1)[-1]
-            fn_track_no, fn_title = parse_track_from_title(last_part)
-            if fn_track_no is not None:
-                return fn_track_no, fn_title
+    return None, title_cleaned
 
-    return track_no, clean_title
 
+def _tags_match(audio, tags: dict) -> bool:
+    """
+    True if every controlled field in `audio` already equals `tags`
+    (fields missing from `tags` must be absent from `audio` too).
+    """
+    return all(audio.get(key) == tags.get(key) for key in _CONTROLLED_KEYS)
 
-def tag_with_mutagen(path: Path, album: str, disc_date: str, disc_number: int):
-    print(f"Processing: {path.name}")
 
-    if path.suffix.lower() not in AUDIO_EXTS:
-        print("  Skipping (not audio)\n")
-        return
+def _tag_with_metaflac(path: Path, tags: dict):
+    """
+    Clear the controlled fields and write `tags` with a single metaflac call.
+    Returns the CompletedProcess; the caller logs its output and checks it.
+    """
+    args = [_METAFLAC]
+    args += [f"--remove-tag={key.upper()}" for key in _CONTROLLED_KEYS]
+    for key, values in tags.items():
+        args += [f"--set-tag={key.upper()}={v}" for v in values]
+    args.append(str(path))
 
-    audio = load_audio(path)
-    if audio is None:
-        print("  Could not read audio file.\n")
-        return
+    # Output is captured (not inherited) so it lands in this file's log block
+    return subprocess.run(args, capture_output=True, text=True)
 
-    track_no, clean_title = get_track_info_from_tags_or_filename(path, audio)
 
-    print(f"  Disc   : {disc_number}")
-    print(f"  Date   : {disc_date}")
-    print(f"  Track #: {track_no}")
-    print(f"  Title  : {clean_title}")
+def tag_with_mutagen(path: Path, album: str, disc_date: str, disc_number: int):
+    """
+    Tag one file and return (new_path, error).
 
-    # Clear controlled fields
-    for key in (
-        "album", "artist", "albumartist",
-        "genre", "discnumber", "date", "year",
-        "releasetype", "tracknumber", "title"
-    ):
-        if key in audio:
-            try:
-                del audio[key]
-            except Exception:
-                pass
+    new_path is the path it should be renamed to (None if the file could not
+    be read or tagging failed); renaming is left to the caller. error is the
+    exception message if tagging raised, so one bad file doesn't abort the rest.
+    """
+    # Output is buffered and printed in one go so concurrent files don't interleave
+    log = [f"Processing: {path.name}"]
+    try:
+        return _tag_file(path, album, disc_date, disc_number, log), None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        log.append(f"  ❌ {error}")
+        return None, error
+    finally:
+        print("\n".join(log) + "\n")
+
+
+def rename_file(path: Path, new_path: Path):
+    if not new_path.exists() and new_path != path:
+        print(f"Renaming: {path.name} → {new_path.name}")
+        path.rename(new_path)
+    else:
+        print(f"Filename unchanged: {path.name}")
 
-    # Tagging
-    audio["album"] = [album]
-    audio["artist"] = [ARTIST_NAME]
-    audio["albumartist"] = [ARTIST_NAME]
 
-    # four backslashes in literal → two backslashes in tag
-    audio["genre"] = ["Psychedelic Rock\\\\Jam Band"]
+def _tag_file(path: Path, album: str, disc_date: str, disc_number: int, log: list):
+    suffix = path.suffix.lower()
+    audio = load_audio(path, suffix)
+    if audio is None:
+        log.append("  Could not read audio file.")
+        return None
 
-    audio["discnumber"] = [str(disc_number)]
+    track_no, clean_title = get_track_info_from_tags_or_filename(path, audio)
 
-    # Per-disc date/year
-    audio["date"] = [disc_date]
-    audio["year"] = [disc_date]
+    log.append(f"  Disc   : {disc_number}")
+    log.append(f"  Date   : {disc_date}")
+    log.append(f"  Track #: {track_no}")
+    log.append(f"  Title  : {clean_title}")
+
+    tags = {
+        "album": [album],
+        "artist": list(_ARTIST_LIST),
+        "albumartist": list(_ARTIST_LIST),
+        "genre": list(_GENRE_LIST),
+        "discnumber": [str(disc_number)],
+        # Per-disc date/year
+        "date": [disc_date],
+        "year": [disc_date],
+    }
 
-    if isinstance(audio, FLAC):
-        audio["releasetype"] = ["album;live"]
+    if isinstance(audio, _FLAC):
+        tags["releasetype"] = list(_RELEASETYPE_LIST)
 
     if clean_title:
-        audio["title"] = [clean_title]
+        tags["title"] = [clean_title]
 
     if track_no is not None:
-        audio["tracknumber"] = [str(track_no)]
+        tags["tracknumber"] = [str(track_no)]
+
+    if _tags_match(audio, tags):
+        # Already tagged correctly (e.g. a re-run) - skip rewriting the file
+        log.append("  Tags unchanged.")
+    elif suffix == ".flac" and _METAFLAC:
+        proc = _tag_with_metaflac(path, tags)
+        for line in (proc.stdout + proc.stderr).splitlines():
+            log.append(f"  metaflac: {line}")
+        proc.check_returncode()
+    else:
+        # Clear controlled fields
+        for key in _CONTROLLED_KEYS:
+            try:
+                audio.pop(key, None)
+            except Exception:
+                pass
+
+        # Tagging
+        for key, values in tags.items():
+            audio[key] = values
 
-    audio.save()
+        audio.save()
 
     # Rename to "07 Extinction.ext"
     safe_title = sanitize_filename(clean_title or "Unknown")
@@ -236,40 +447,40 @@ def tag_with_mutagen(path: Path, album: str, disc_date: str, disc_number: int):
     else:
         new_base = safe_title
 
-    new_name = new_base + path.suffix.lower()
-    new_path = path.with_name(new_name)
-
-    if not new_path.exists() and new_path != path:
-        print(f"  Renaming → {new_name}\n")
-        path.rename(new_path)
-    else:
-        print("  Filename unchanged.\n")
+    return path.with_name(new_base + suffix)
 
 
 def main():
+    # --refresh bypasses the Setlist.fm response cache
+    args = sys.argv[1:]
+    refresh = "--refresh" in args
+    args = [a for a in args if a != "--refresh"]
+
     # Require: folder + at least one date
-    if len(sys.argv) < 3:
+    if len(args) < 2:
         print("\nUsage:")
-        print("  python tag_kglwBL.py /path/to/folder yyyy-mm-dd [yyyy-mm-dd ...]\n")
+        print("  python tag_kglwBL.py [--refresh] /path/to/folder yyyy-mm-dd [yyyy-mm-dd ...]\n")
         print("Example:")
         print("  python tag_kglwBL.py \"D:/Music/KGLW/Berlin_Run\" 2025-10-24 2025-10-25\n")
+        print("  --refresh  ignore cached Setlist.fm data and fetch it again\n")
         print("❌ Missing required args.\n")
         return
 
-    folder = Path(sys.argv[1])
-    date_list = [d.strip() for d in sys.argv[2:]]
+    folder = Path(args[0])
+    date_list = [d.strip() for d in args[1:]]
 
     if not folder.is_dir():
         print(f"❌ Folder not found: {folder}")
         return
 
-    # Fetch location & setlists for each date
-    locations = []
-    setlists_per_date = []
-    for d in date_list:
-        loc, sl = fetch_album_name_and_setlist(d)
-        locations.append(loc)
-        setlists_per_date.append(sl)
+    # Fetch location & setlists for each date (concurrently, order preserved)
+    with ThreadPoolExecutor(max_workers=min(_SETLISTFM_MAX_CONCURRENCY, len(date_list))) as ex:
+        results = list(ex.map(
+            lambda d: fetch_album_name_and_setlist(d, refresh=refresh), date_list
+        ))
+
+    locations = [loc for loc, _ in results]
+    setlists_per_date = [sl for _, sl in results]
 
     # Album name is based on FIRST date only
     first_date = date_list[0]
@@ -306,8 +517,19 @@ def main():
 
     print("\n✔ Proceeding...\n")
 
-    # Determine per-file disc mapping based on setlist lengths
-    files = [f for f in sorted(folder.iterdir()) if f.is_file()]
+    # Determine per-file disc mapping based on setlist lengths.
+    # Only audio files count towards track positions.
+    # scandir's DirEntry caches is_file() from readdir; normcase keeps the
+    # case-insensitive ordering Path comparison gives on Windows.
+    with os.scandir(folder) as it:
+        entries = sorted(
+            (
+                e for e in it
+                if e.is_file() and os.path.splitext(e.name)[1].lower() in AUDIO_EXTS
+            ),
+            key=lambda e: os.path.normcase(e.name),
+        )
+    files = [Path(e.path) for e in entries]
 
     # Number of tracks per date from setlists
     track_counts = [len(sl) for sl in setlists_per_date]
@@ -326,17 +548,39 @@ def main():
         Given file index, determine disc index (0-based) and date.
         Uses cumulative setlist lengths. Extra files → last disc.
         """
-        for disc_idx, boundary in enumerate(cumulative):
-            if idx < boundary:
-                return disc_idx
-        return len(date_list) - 1  # fall back to last disc
+        # First boundary strictly greater than idx; past the end → last disc
+        return min(bisect.bisect_right(cumulative, idx), len(date_list) - 1)
 
-    # Tag each file with disc/date based on its position
-    for i, entry in enumerate(files):
+    # (disc_number, disc_date) for every file position, computed up front
+    assignments = []
+    for i in range(len(files)):
         disc_idx = get_disc_for_index(i)
-        disc_number = disc_idx + 1
-        disc_date = date_list[disc_idx]
-        tag_with_mutagen(entry, album_name, disc_date, disc_number)
+        assignments.append((disc_idx + 1, date_list[disc_idx]))
+
+    # Tag each file with disc/date based on its position.
+    # Files are independent and the work is I/O-bound, so use a thread pool.
+    jobs = [
+        (entry, album_name, disc_date, disc_number)
+        for entry, (disc_number, disc_date) in zip(files, assignments)
+    ]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        results = list(ex.map(lambda args: tag_with_mutagen(*args), jobs))
+
+    # Rename to "07 Extinction.ext" serially, in file order, so name
+    # collisions resolve the same way on every run
+    failures = []
+    for entry, (new_path, error) in zip(files, results):
+        if error is not None:
+            failures.append((entry, error))
+        elif new_path is not None:
+            rename_file(entry, new_path)
+    print()
+
+    if failures:
+        print(f"⚠ {len(failures)} file(s) failed to tag and were not renamed:")
+        for entry, error in failures:
+            print(f"  {entry.name}: {error}")
+        print()
 
     # Rename folder to album name (based on first date)
     safe_folder_name = sanitize_filename(album_name)